@@ -8,23 +8,91 @@
 # AUTHORS file for copyright and authorship information.
 
 import locale
+import threading
+import time
 from collections import OrderedDict
 
 from django.conf import settings
 from django.core.cache import cache
 from django.core.urlresolvers import reverse
-from django.db import models
+from django.db import connection, models
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
 
-from pootle.core.cache import make_method_key
+from pootle.core.cache import get_cache, make_method_key
 from pootle.core.mixins import TreeItem
 from pootle.core.url_helpers import get_editor_filter
 from pootle.i18n.gettext import tr_lang, language_dir
 from staticpages.models import StaticPage
 
 
+# Per-process copy of `cached_dict()` results, as a `(version, data)` pair
+# tagging the results with the version counter they were built from. The
+# pair is only ever replaced as a whole, so threads never mix versions
+_LOCAL = {'current': (None, {})}
+
+
+class LanguagesVersion(object):
+    """Wrapper around the live languages version counter stored in Redis."""
+
+    CACHE_KEY = 'pootle:languages:version'
+
+    cache = get_cache('redis')
+
+    @classmethod
+    def initial(cls):
+        """Returns a time-based initial version number, so a counter that
+        got lost never comes back with a value some process may still hold.
+        """
+        return int(time.time() * 1000)
+
+    @classmethod
+    def get(cls):
+        """Gets the current version number, initializing it if needed."""
+        version = cls.cache.get(cls.CACHE_KEY)
+        if version is None:
+            cls.add(cls.initial())
+            version = cls.cache.get(cls.CACHE_KEY)
+
+        return version
+
+    @classmethod
+    def add(cls, value):
+        """Sets the version number to `value`, only if there's no version
+        already set.
+
+        :return: `True` if the value was set, `False` otherwise.
+        """
+        return cls.cache.add(cls.CACHE_KEY, value)
+
+    @classmethod
+    def incr(cls):
+        """Increments the version number, invalidating all cached live
+        language listings, both shared and per-process.
+        """
+        try:
+            cls.cache.incr(cls.CACHE_KEY)
+        except ValueError:
+            cls.add(cls.initial())
+
+
+# Per-thread (hence per-connection) flag for a pending version bump
+_pending_bump = threading.local()
+
+
+def _run_pending_languages_version_bump():
+    if getattr(_pending_bump, 'value', False):
+        _pending_bump.value = False
+        LanguagesVersion.incr()
+
+
+def schedule_languages_version_bump():
+    """Bumps the live languages version once per transaction, on commit."""
+    _pending_bump.value = True
+    connection.on_commit(_run_pending_languages_version_bump)
+
+
 class LanguageManager(models.Manager):
 
     def get_queryset(self):
@@ -36,26 +104,38 @@ class LanguageManager(models.Manager):
         )
 
 
-class LiveLanguageManager(models.Manager):
+class LiveLanguageManager(LanguageManager):
     """Manager that only considers `live` languages.
 
     A live language is any language containing at least a project with
     translatable files.
     """
     def get_queryset(self):
+        # Use a subquery rather than joining translation projects, which
+        # would require a `DISTINCT` pass over the joined rows
+        from pootle_translationproject.models import TranslationProject
+        tp_languages = TranslationProject.objects.values('language')
+
         return super(LiveLanguageManager, self).get_queryset().filter(
-                translationproject__isnull=False,
+                pk__in=tp_languages,
                 project__isnull=True,
-            ).distinct()
+            )
 
     def cached_dict(self, locale_code='en-us'):
         """Retrieves a sorted list of live language codes and names.
 
         :param locale_code: the UI locale for which language full names need to
             be localized.
-        :return: an `OrderedDict`
+        :return: an `OrderedDict`. This is a plain, fully evaluated object
+            shared across calls, so callers must treat it as read-only.
         """
-        key = make_method_key(self, 'cached_dict', locale_code)
+        version = LanguagesVersion.get()
+        local_version, local_data = _LOCAL['current']
+        if local_version == version and locale_code in local_data:
+            return local_data[locale_code]
+
+        key = make_method_key(self, 'cached_dict',
+                              {'locale': locale_code, 'version': version})
         languages = cache.get(key, None)
         if languages is None:
             languages = OrderedDict(
@@ -64,7 +144,16 @@ class LiveLanguageManager(models.Manager):
                         cmp=locale.strcoll,
                         key=lambda x: x[1])
             )
-            cache.set(key, languages, settings.POOTLE_CACHE_TIMEOUT)
+            # Concurrent fills after an invalidation compute the same
+            # value: keep whichever was stored first
+            cache.add(key, languages, settings.POOTLE_CACHE_TIMEOUT)
+
+        # Re-read the local copy, another thread may have replaced it
+        local_version, local_data = _LOCAL['current']
+        if local_version != version:
+            local_data = {}
+            _LOCAL['current'] = (version, local_data)
+        local_data[locale_code] = languages
 
         return languages
 
@@ -136,9 +225,11 @@ class Language(models.Model, TreeItem):
         return u'<%s: %s>' % (self.__class__.__name__, self.fullname)
 
     def save(self, *args, **kwargs):
-        # create corresponding directory object
-        from pootle_app.models.directory import Directory
-        self.directory = Directory.objects.root.get_or_make_subdir(self.code)
+        # create corresponding directory object, unless it's already in place
+        if self.directory_id is None or self.directory.name != self.code:
+            from pootle_app.models.directory import Directory
+            self.directory = \
+                Directory.objects.root.get_or_make_subdir(self.code)
 
         super(Language, self).save(*args, **kwargs)
 
@@ -151,10 +242,8 @@ class Language(models.Model, TreeItem):
         return reverse('pootle-language-browse', args=[self.code])
 
     def get_translate_url(self, **kwargs):
-        return u''.join([
-            reverse('pootle-language-translate', args=[self.code]),
-            get_editor_filter(**kwargs),
-        ])
+        return (reverse('pootle-language-translate', args=[self.code]) +
+                get_editor_filter(**kwargs))
 
     def clean(self):
         super(Language, self).clean()
@@ -197,5 +286,4 @@ def invalidate_language_list_cache(sender, instance, **kwargs):
     if instance.__class__.__name__ not in ['Language', 'TranslationProject']:
         return
 
-    key = make_method_key('LiveLanguageManager', 'cached_dict', '*')
-    cache.delete_pattern(key)
+    schedule_languages_version_bump()
@@ -142,57 +142,64 @@ class TreeItem(object):
             self.initialize_children()
         return self._children
 
-    def _calc_suggestion_count(self):
+    def get_children_cached(self, name):
+        """Retrieves the `name` stat values for all children, fetching them
+        from the cache in a single round-trip.
+
+        :return: a list of values, one per child, in children order.
+        """
         self.initialize_children()
+        children = list(self.children)
+        keys = [item.get_cached_key(name) for item in children]
+        values = cache.get_many(keys)
+
+        result = []
+        for item, key in zip(children, keys):
+            value = values.get(key)
+            if value is None:
+                # Let the child report (and log) the cache miss
+                value = item.get_cached(name)
+            result.append(value)
+
+        return result
+
+    def _calc_suggestion_count(self):
         return (self._get_suggestion_count() +
-                sum([item.get_cached(CachedMethods.SUGGESTIONS)
-                     for item in self.children]))
+                sum(self.get_children_cached(CachedMethods.SUGGESTIONS)))
 
     def _calc_wordcount_stats(self):
         result = self._get_wordcount_stats()
-        self.initialize_children()
-        for item in self.children:
-            result = dictsum(
-                result,
-                item.get_cached(CachedMethods.WORDCOUNT_STATS)
-            )
+        for item_res in self.get_children_cached(
+                CachedMethods.WORDCOUNT_STATS):
+            result = dictsum(result, item_res)
 
         return result
 
     def _calc_last_action(self):
-        self.initialize_children()
-
         return max(
             [self._get_last_action()] +
-            [item.get_cached(CachedMethods.LAST_ACTION)
-             for item in self.children],
+            self.get_children_cached(CachedMethods.LAST_ACTION),
             key=lambda x: x['mtime'] if 'mtime' in x else 0
         )
 
     def _calc_mtime(self):
         """get latest modification time"""
-        self.initialize_children()
         return max(
             [self._get_mtime()] +
-            [item.get_cached(CachedMethods.MTIME)
-             for item in self.children]
+            self.get_children_cached(CachedMethods.MTIME)
         )
 
     def _calc_last_updated(self):
         """get last updated"""
-        self.initialize_children()
         return max(
             [self._get_last_updated()] +
-            [item.get_cached(CachedMethods.LAST_UPDATED)
-             for item in self.children],
+            self.get_children_cached(CachedMethods.LAST_UPDATED),
             key=lambda x: x['creation_time'] if 'creation_time' in x else 0
         )
 
     def _calc_checks(self):
         result = self._get_checks()
-        self.initialize_children()
-        for item in self.children:
-            item_res = item.get_cached(CachedMethods.CHECKS)
+        for item_res in self.get_children_cached(CachedMethods.CHECKS):
             result['checks'] = dictsum(result['checks'], item_res['checks'])
             result['unit_critical_error_count'] += item_res['unit_critical_error_count']
 
@@ -288,13 +295,14 @@ class CachedTreeItem(TreeItem):
         """This method will be overridden in descendants"""
         return True
 
+    def get_cached_key(self, name):
+        return iri_to_uri(self.get_cachekey() + ":" + name)
+
     def set_cached_value(self, name, value):
-        key = iri_to_uri(self.get_cachekey() + ":" + name)
-        return cache.set(key, value, None)
+        return cache.set(self.get_cached_key(name), value, None)
 
     def get_cached_value(self, name):
-        key = iri_to_uri(self.get_cachekey() + ":" + name)
-        return cache.get(key)
+        return cache.get(self.get_cached_key(name))
 
     def get_last_job_key(self):
         key = self.get_cachekey()
@@ -13,26 +13,14 @@ from django_rq.queues import get_queue
 from django_rq.workers import Worker
 
 
-def redis_is_running():
-    """Checks is redis is running
-
-    :returns: `True` if redis is running, `False` otherwise.
-    """
-    try:
-        queue = get_queue()
-        Worker.all(queue.connection)
-    except ConnectionError:
-        return False
-    return True
-
-
 def rq_workers_are_running():
     """Checks if there are any rq workers running
 
     :returns: `True` if there are rq workers running, `False` otherwise.
     """
-    if redis_is_running():
+    try:
         queue = get_queue()
-        if len(queue.connection.smembers(Worker.redis_workers_keys)):
-            return True
-    return False
+        # `Worker.all()` also prunes stale entries left by dead workers
+        return len(Worker.all(queue.connection)) > 0
+    except ConnectionError:
+        return False
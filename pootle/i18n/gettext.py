@@ -8,6 +8,7 @@
 # AUTHORS file for copyright and authorship information.
 
 from django.utils import translation
+from django.utils.lru_cache import lru_cache
 from django.utils.translation import _trans
 
 from translate.lang import data as langdata
@@ -50,9 +51,15 @@ def tr_lang(language_name):
     """Translates language names."""
     language_code = translation.to_locale(translation.get_language())
 
+    return _tr_lang(language_code, language_name)
+
+
+@lru_cache(maxsize=512)
+def _tr_lang(language_code, language_name):
     return langdata.tr_lang(language_code)(language_name)
 
 
+@lru_cache(maxsize=512)
 def language_dir(language_code):
     """Returns whether the language is right to left"""
     RTL_LANGS = [
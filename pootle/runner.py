@@ -7,17 +7,13 @@
 # or later license. See the LICENSE file for a copy of the license and the
 # AUTHORS file for copyright and authorship information.
 
+import io
 import os
 import sys
 from argparse import ArgumentParser, SUPPRESS
 
-from django.conf import settings
-from django.core import management
-
 import syspath_override
 
-from .core.utils.redis_rq import rq_workers_are_running
-
 
 #: Length for the generated :setting:`SECRET_KEY`
 KEY_LENGTH = 50
@@ -32,6 +28,16 @@ SETTINGS_TEMPLATE_FILENAME = 'settings/90-local.conf.template'
 if sys.version_info[0] < 3:
     input = raw_input
 
+try:
+    from secrets import token_urlsafe
+except ImportError:
+    # Python 2 support for secrets.token_urlsafe()
+    from base64 import urlsafe_b64encode
+
+    def token_urlsafe(nbytes):
+        return urlsafe_b64encode(os.urandom(nbytes)).rstrip(b'=') \
+                                                     .decode('ascii')
+
 
 def add_help_to_parser(parser):
     parser.add_help = True
@@ -58,8 +64,6 @@ def init_settings(settings_filepath, template_filename,
     :param db_port: Database port. Defaults to backend default. Not used with
         sqlite.
     """
-    from base64 import b64encode
-
     dirname = os.path.dirname(settings_filepath)
     if dirname and not os.path.exists(dirname):
         os.makedirs(dirname)
@@ -81,8 +85,7 @@ def init_settings(settings_filepath, template_filename,
         }[db]
 
     context = {
-        "default_key": ("'%s'"
-                        % b64encode(os.urandom(KEY_LENGTH)).decode("utf-8")),
+        "default_key": "'%s'" % token_urlsafe(KEY_LENGTH),
         "db_engine": "'transaction_hooks.backends.%s'" % db_module,
         "db_name": db_name,
         "db_user": db_user,
@@ -91,9 +94,11 @@ def init_settings(settings_filepath, template_filename,
         "db_port": db_port,
     }
 
-    with open(settings_filepath, 'w') as settings:
-        with open(template_filename) as template:
-            settings.write(template.read() % context)
+    with io.open(settings_filepath, 'w', encoding='utf-8') as settings:
+        with io.open(template_filename, encoding='utf-8') as template:
+            # Only lines with format markers or escapes need substitution
+            for line in template:
+                settings.write(line % context if '%' in line else line)
 
 
 def init_command(parser, settings_template, args):
@@ -103,6 +108,7 @@ def init_command(parser, settings_template, args):
     :param settings_template: Template file for initializing settings from.
     :param args: Arguments to call init command with.
     """
+    from django.core import management
 
     src_dir = os.path.abspath(os.path.dirname(__file__))
     add_help_to_parser(parser)
@@ -162,6 +168,10 @@ def init_command(parser, settings_template, args):
 def set_sync_mode(noinput=False):
     """Sets ASYNC = False on all redis worker queues
     """
+    from django.conf import settings
+
+    from .core.utils.redis_rq import rq_workers_are_running
+
     if rq_workers_are_running():
         redis_warning = ("\nYou currently have RQ workers running.\n\n"
                          "Running in synchronous mode may conflict with jobs "
@@ -177,7 +187,7 @@ def set_sync_mode(noinput=False):
                 exit(2)
 
     # Update settings to set queues to ASYNC = False.
-    for q in settings.RQ_QUEUES.itervalues():
+    for q in settings.RQ_QUEUES.values():
         q['ASYNC'] = False
 
 
@@ -230,11 +240,6 @@ def run_app(project, default_settings_path, settings_template,
     parser = ArgumentParser(add_help=False)
     parser.add_argument("--version", action="version",
                         version=get_version())
-
-    # Print version and exit if --version present
-    args, remainder = parser.parse_known_args(sys.argv[1:])
-
-    # Add pootle args
     parser.add_argument(
         "--config",
         default=default_settings_path,
@@ -256,11 +261,13 @@ def run_app(project, default_settings_path, settings_template,
 
     # Parse the init command by hand to prevent raising a SystemExit while
     # parsing
-    args_provided = [c for c in sys.argv[1:] if not c.startswith("-")]
-    if args_provided and args_provided[0] == "init":
+    first_command = next((c for c in sys.argv[1:] if not c.startswith("-")),
+                         None)
+    if first_command == "init":
         init_command(parser, settings_template, sys.argv[1:])
         sys.exit(0)
 
+    # Print version and exit if --version present
     args, remainder = parser.parse_known_args(sys.argv[1:])
 
     # Configure settings from args.config path
@@ -296,6 +303,7 @@ def run_app(project, default_settings_path, settings_template,
     if args.noinput:
         command += ["--noinput"]
 
+    from django.core import management
     management.execute_from_command_line(command)
     sys.exit(0)
 
@@ -9,6 +9,9 @@
 
 import pytest
 
+from pootle.core.mixins import treeitem
+from pootle.core.mixins.treeitem import (CachedMethods, CachedTreeItem,
+                                         NoCachedStats, TreeItem)
 from pootle_app.models import Directory
 from pootle_project.models import Project
 from pootle_store.models import Store
@@ -59,3 +62,86 @@ def test_get_parents(af_tutorial_subdir_po, af_tutorial_po,
 
     parents = afrikaans.directory.get_parents()
     assert len(parents) == 0
+
+
+class DummyCachedItem(CachedTreeItem):
+
+    def __init__(self, cachekey):
+        self.cachekey = cachekey
+        super(DummyCachedItem, self).__init__()
+
+    def get_cachekey(self):
+        return self.cachekey
+
+
+class DummyParentItem(TreeItem):
+
+    def __init__(self, children):
+        self.dummy_children = children
+        super(DummyParentItem, self).__init__()
+
+    def get_children(self):
+        return self.dummy_children
+
+    def get_cachekey(self):
+        return '/dummy-parent/'
+
+
+@pytest.fixture
+def dummy_children(request):
+    """Require three cached tree items with cached suggestion counts."""
+    children = [DummyCachedItem('/dummy-child-%d/' % i) for i in range(3)]
+    for i, child in enumerate(children):
+        child.set_cached_value(CachedMethods.SUGGESTIONS, i + 1)
+
+    def _delete_cached_values():
+        treeitem.cache.delete_many([
+            child.get_cached_key(CachedMethods.SUGGESTIONS)
+            for child in children
+        ])
+    request.addfinalizer(_delete_cached_values)
+
+    return children
+
+
+def test_get_children_cached_single_lookup(dummy_children, monkeypatch):
+    """Ensure children values are retrieved with a single cache lookup."""
+    calls = []
+    get_many = treeitem.cache.get_many
+
+    def _get_many(keys):
+        calls.append(keys)
+        return get_many(keys)
+
+    def _get(*args, **kwargs):
+        raise AssertionError('Unexpected per-child cache lookup')
+
+    monkeypatch.setattr(treeitem.cache, 'get_many', _get_many)
+    monkeypatch.setattr(treeitem.cache, 'get', _get)
+
+    parent = DummyParentItem(dummy_children)
+    assert parent.get_children_cached(CachedMethods.SUGGESTIONS) == [1, 2, 3]
+    assert parent._calc_suggestion_count() == 6
+    assert len(calls) == 2
+    assert len(calls[0]) == len(dummy_children)
+
+
+def test_get_children_cached_miss(dummy_children):
+    """Ensure a child missing its cached value raises `NoCachedStats`."""
+    treeitem.cache.delete(
+        dummy_children[1].get_cached_key(CachedMethods.SUGGESTIONS)
+    )
+
+    parent = DummyParentItem(dummy_children)
+    with pytest.raises(NoCachedStats):
+        parent.get_children_cached(CachedMethods.SUGGESTIONS)
+
+
+def test_get_children_cached_no_children():
+    """Ensure items without children only account for their own stats."""
+    parent = DummyParentItem([])
+
+    assert parent.get_children_cached(CachedMethods.SUGGESTIONS) == []
+    assert parent._calc_suggestion_count() == parent._get_suggestion_count()
+    assert (parent._calc_wordcount_stats() ==
+            parent._get_wordcount_stats())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) Pootle contributors.
+#
+# This file is a part of the Pootle project. It is distributed under the GPL3
+# or later license. See the LICENSE file for a copy of the license and the
+# AUTHORS file for copyright and authorship information.
+
+import pytest
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from pootle_language.models import Language, LanguagesVersion
+
+
+@pytest.mark.django_db
+def test_live_cached_dict_invalidation(french_tutorial):
+    """Tests the cached live languages are kept until invalidated."""
+    assert Language.live.cached_dict()['fr'] == 'French'
+
+    # Bypass signals: cached values are still in use
+    Language.objects.filter(code='fr').update(fullname='Parisian')
+    assert Language.live.cached_dict()['fr'] == 'French'
+
+    french_tutorial.save()
+    assert Language.live.cached_dict()['fr'] == 'Parisian'
+
+
+@pytest.mark.django_db
+def test_live_cached_dict_lost_version(french_tutorial):
+    """Tests the cached live languages are refreshed after the version
+    counter is lost.
+    """
+    assert Language.live.cached_dict()['fr'] == 'French'
+
+    LanguagesVersion.cache.delete(LanguagesVersion.CACHE_KEY)
+    Language.objects.filter(code='fr').update(fullname='Parisian')
+    french_tutorial.save()
+
+    assert Language.live.cached_dict()['fr'] == 'Parisian'
+
+
+@pytest.mark.django_db
+def test_live_languages_unique(afrikaans_tutorial, afrikaans_vfolder_test):
+    """Tests languages with several translation projects are only listed
+    once as live languages.
+    """
+    assert list(Language.live.values_list('code', flat=True)) == ['af']
+
+
+@pytest.mark.django_db
+def test_languages_version_bump_scheduled_once(afrikaans_tutorial,
+                                               afrikaans_vfolder_test):
+    """Tests changing several translation projects within a transaction only
+    bumps the languages version once, after committing.
+    """
+    version = LanguagesVersion.get()
+    with transaction.atomic():
+        afrikaans_tutorial.save()
+        afrikaans_vfolder_test.save()
+
+        assert LanguagesVersion.get() == version
+
+    assert LanguagesVersion.get() == version + 1
+
+
+@pytest.mark.django_db
+def test_languages_version_bump_savepoint_rollback(afrikaans_tutorial,
+                                                   afrikaans_vfolder_test):
+    """Tests the languages version is still bumped when the savepoint that
+    scheduled the first bump is rolled back.
+    """
+    version = LanguagesVersion.get()
+    with transaction.atomic():
+        try:
+            with transaction.atomic():
+                afrikaans_tutorial.save()
+                raise ValueError
+        except ValueError:
+            pass
+
+        afrikaans_vfolder_test.save()
+
+    assert LanguagesVersion.get() == version + 1
+
+
+@pytest.mark.django_db
+def test_save_keeps_existing_directory(french):
+    """Tests saving an existing language doesn't look its directory up
+    again.
+    """
+    directory_pk = french.directory.pk
+
+    with CaptureQueriesContext(connection) as queries:
+        french.save()
+
+    assert french.directory.pk == directory_pk
+    assert not [query for query in queries
+                if 'pootle_app_directory' in query['sql']]
+
+
+@pytest.mark.django_db
+def test_live_languages_select_directory(french_tutorial):
+    """Tests live languages come with their directory already fetched."""
+    language = Language.live.get(code='fr')
+
+    with CaptureQueriesContext(connection) as queries:
+        language.get_cachekey()
+
+    assert len(queries) == 0